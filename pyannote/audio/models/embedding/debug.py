@@ -25,7 +25,6 @@ from typing import Optional
 
 import torch
 import torch.nn as nn
-from einops import rearrange, reduce
 from torchaudio.transforms import MFCC
 
 from pyannote.audio.core.model import Model
@@ -75,6 +74,9 @@ class SimpleEmbeddingModel(Model):
         """
 
         mfcc = self.mfcc(waveforms)
-        output, hidden = self.lstm(rearrange(mfcc, "b c f t -> b t (c f)"))
+        batch_size, _, _, num_frames = mfcc.shape
+        output, hidden = self.lstm(
+            mfcc.permute(0, 3, 1, 2).reshape(batch_size, num_frames, -1)
+        )
         # mean temporal pooling
-        return reduce(output, "b t f -> b f", "mean")
+        return output.mean(dim=1)
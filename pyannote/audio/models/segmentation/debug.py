@@ -21,12 +21,11 @@
 # SOFTWARE.
 
 
-from functools import cached_property, lru_cache
+from functools import cached_property
 from typing import Optional
 
 import torch
 import torch.nn as nn
-from einops import rearrange
 from pyannote.core import SlidingWindow
 from torchaudio.transforms import MFCC
 
@@ -51,6 +50,14 @@ class SimpleSegmentationModel(Model):
             log_mels=False,
         )
 
+        # cache STFT parameters used by num_frames, receptive_field_size
+        # and receptive_field
+        spectrogram = self.mfcc.MelSpectrogram.spectrogram
+        self._win_length: int = spectrogram.win_length
+        self._hop_length: int = spectrogram.hop_length
+        self._n_fft: int = spectrogram.n_fft
+        self._center: bool = spectrogram.center
+
         self.lstm = nn.LSTM(
             self.mfcc.n_mfcc * self.hparams.num_channels,
             32,
@@ -59,7 +66,6 @@ class SimpleSegmentationModel(Model):
             bidirectional=True,
         )
 
-    @lru_cache
     def num_frames(self, num_samples: int) -> int:
         """Compute number of output frames for a given number of input samples
 
@@ -79,14 +85,10 @@ class SimpleSegmentationModel(Model):
 
         """
 
-        hop_length = self.mfcc.MelSpectrogram.spectrogram.hop_length
-        n_fft = self.mfcc.MelSpectrogram.spectrogram.n_fft
-        center = self.mfcc.MelSpectrogram.spectrogram.center
-        return int(
-            1 + num_samples // hop_length
-            if center
-            else 1 + (num_samples - n_fft) // hop_length
-        )
+        if self._center:
+            return int(1 + num_samples // self._hop_length)
+        else:
+            return int(1 + (num_samples - self._n_fft) // self._hop_length)
 
     def receptive_field_size(self, num_frames: int = 1) -> int:
         """Compute receptive field size
@@ -102,14 +104,10 @@ class SimpleSegmentationModel(Model):
             Receptive field size
         """
 
-        hop_length = self.mfcc.MelSpectrogram.spectrogram.hop_length
-        n_fft = self.mfcc.MelSpectrogram.spectrogram.n_fft
-        center = self.mfcc.MelSpectrogram.spectrogram.center
-
-        if center:
-            return (num_frames - 1) * hop_length
+        if self._center:
+            return (num_frames - 1) * self._hop_length
         else:
-            return (num_frames - 1) * hop_length + n_fft
+            return (num_frames - 1) * self._hop_length + self._n_fft
 
     @cached_property
     def receptive_field(self) -> SlidingWindow:
@@ -126,14 +124,10 @@ class SimpleSegmentationModel(Model):
         """
 
         # duration of the receptive field of each output frame
-        duration = (
-            self.mfcc.MelSpectrogram.spectrogram.win_length / self.hparams.sample_rate
-        )
+        duration = self._win_length / self.hparams.sample_rate
 
         # step between the receptive field region of two consecutive output frames
-        step = (
-            self.mfcc.MelSpectrogram.spectrogram.hop_length / self.hparams.sample_rate
-        )
+        step = self._hop_length / self.hparams.sample_rate
 
         return SlidingWindow(start=0.0, duration=duration, step=step)
 
@@ -165,9 +159,16 @@ class SimpleSegmentationModel(Model):
         -------
         scores : (batch, time, classes)
         """
-        # extract MFCC
+        # extract MFCC (with waveforms cast to the dtype of MFCC filterbanks)
+        waveforms = waveforms.to(self.mfcc.dct_mat.dtype)
         mfcc = self.mfcc(waveforms)
+        # (batch, channel, feature, frame) -> (batch, frame, channel x feature)
+        # torchaudio's MFCC returns a transposed view of a (..., frame, feature)
+        # contiguous tensor, so for mono audio this is a zero-copy view and the
+        # subsequent .contiguous() call is a no-op.
+        batch_size, _, _, num_frames = mfcc.shape
+        mfcc = mfcc.permute(0, 3, 1, 2).reshape(batch_size, num_frames, -1)
         # pass MFCC sequeence into the recurrent layer
-        output, hidden = self.lstm(rearrange(mfcc, "b c f t -> b t (c f)"))
+        output, hidden = self.lstm(mfcc.contiguous())
         # apply the final classifier to get logits
         return self.activation(self.classifier(output))
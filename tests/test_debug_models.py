@@ -0,0 +1,131 @@
+# MIT License
+#
+# Copyright (c) 2023- CNRS
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import functools
+
+import pytest
+import torch
+from einops import rearrange, reduce
+from torchaudio.transforms import MFCC
+
+from pyannote.audio.core.task import Problem, Resolution, Specifications
+from pyannote.audio.models.embedding.debug import SimpleEmbeddingModel
+from pyannote.audio.models.segmentation import debug
+from pyannote.audio.models.segmentation.debug import SimpleSegmentationModel
+
+
+@pytest.fixture(params=[True, False], ids=["center", "no_center"])
+def segmentation_model(request, monkeypatch):
+    # build the model through its regular constructor, with the (centered or
+    # not) STFT configuration passed down to torchaudio's MFCC transform
+    monkeypatch.setattr(
+        debug,
+        "MFCC",
+        functools.partial(MFCC, melkwargs={"center": request.param}),
+    )
+    return SimpleSegmentationModel()
+
+
+def test_simple_segmentation_stft_parameters(segmentation_model):
+    spectrogram = segmentation_model.mfcc.MelSpectrogram.spectrogram
+
+    assert segmentation_model._win_length == spectrogram.win_length
+    assert segmentation_model._hop_length == spectrogram.hop_length
+    assert segmentation_model._n_fft == spectrogram.n_fft
+    assert segmentation_model._center == spectrogram.center
+
+
+def test_simple_segmentation_num_frames(segmentation_model):
+    n_fft = segmentation_model.mfcc.MelSpectrogram.spectrogram.n_fft
+
+    for num_samples in [n_fft, 16000, 16000 + 7, 32123]:
+        mfcc = segmentation_model.mfcc(torch.randn(1, 1, num_samples))
+        assert segmentation_model.num_frames(num_samples) == mfcc.shape[-1]
+
+
+def test_simple_segmentation_receptive_field_size(segmentation_model):
+    # (at least 3 frames, for centered STFT reflect-padding to be valid)
+    for num_frames in [3, 10, 100]:
+        num_samples = segmentation_model.receptive_field_size(num_frames)
+        mfcc = segmentation_model.mfcc(torch.randn(1, 1, num_samples))
+        assert mfcc.shape[-1] == num_frames
+
+
+def test_simple_segmentation_receptive_field(segmentation_model):
+    spectrogram = segmentation_model.mfcc.MelSpectrogram.spectrogram
+    sample_rate = segmentation_model.hparams.sample_rate
+    receptive_field = segmentation_model.receptive_field
+
+    assert receptive_field.duration == spectrogram.win_length / sample_rate
+    assert receptive_field.step == spectrogram.hop_length / sample_rate
+
+
+def _build(model):
+    model.specifications = Specifications(
+        problem=Problem.BINARY_CLASSIFICATION,
+        resolution=Resolution.FRAME,
+        duration=1.0,
+        classes=["speech"],
+    )
+    model.build()
+    return model.eval()
+
+
+def test_simple_segmentation_lstm_input_layout():
+    model = _build(SimpleSegmentationModel())
+    waveforms = torch.randn(3, 1, 16000)
+
+    # previous implementation, based on einops
+    with torch.no_grad():
+        mfcc = model.mfcc(waveforms)
+        output, _ = model.lstm(rearrange(mfcc, "b c f t -> b t (c f)"))
+        expected = model.activation(model.classifier(output))
+
+        assert torch.allclose(model(waveforms), expected)
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.float64])
+def test_simple_segmentation_float64_input(dtype):
+    model = _build(SimpleSegmentationModel()).to(dtype)
+    waveforms = torch.randn(2, 1, 16000, dtype=torch.float64)
+
+    with torch.no_grad():
+        scores = model(waveforms)
+
+    assert scores.dtype == dtype
+    assert scores.shape == (2, model.num_frames(16000), 1)
+
+
+def test_simple_embedding_pooling():
+    model = SimpleEmbeddingModel().eval()
+    waveforms = torch.randn(3, 1, 16000)
+
+    # previous implementation, based on einops
+    with torch.no_grad():
+        mfcc = model.mfcc(waveforms)
+        output, _ = model.lstm(rearrange(mfcc, "b c f t -> b t (c f)"))
+        expected = reduce(output, "b t f -> b f", "mean")
+
+        embeddings = model(waveforms)
+
+    assert embeddings.shape == (3, model.dimension)
+    assert torch.allclose(embeddings, expected)